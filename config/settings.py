@@ -1,193 +1,265 @@
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
-# Try to use the new settings system, fallback to simple config if it fails
-try:
-    from pydantic import BaseSettings, Field, validator
+# Resolved once at import; every path below derives from this constant
+_ROOT = Path(__file__).resolve().parent.parent
 
-    class Settings(BaseSettings):
-        """Application settings with environment variable support"""
+_VALID_SEARCH_METHODS = ("similarity", "mmr", "smart", "detailed")
 
-        # Project paths
-        PROJECT_ROOT: Path = Path(__file__).parent.parent
-        DATA_DIR: Path = Field(
-            default_factory=lambda: Path(__file__).parent.parent / "data"
-        )
-        VECTORSTORE_DIR: Path = Field(
-            default_factory=lambda: Path(__file__).parent.parent / "vectorstore"
-        )
-        LOGS_DIR: Path = Field(
-            default_factory=lambda: Path(__file__).parent.parent / "logs"
-        )
 
-        # Embedding configuration
-        EMBEDDING_MODEL: str = Field(default="all-MiniLM-L6-v2", env="EMBEDDING_MODEL")
-        CHUNK_SIZE: int = Field(default=1000, env="CHUNK_SIZE")
-        CHUNK_OVERLAP: int = Field(default=200, env="CHUNK_OVERLAP")
+@lru_cache(maxsize=1)
+def _env() -> Dict[str, str]:
+    """Environment values overlaid on a one-shot parse of the .env file.
 
-        # Agent configuration
-        OLLAMA_BASE_URL: str = Field(
-            default="http://localhost:11434", env="OLLAMA_BASE_URL"
-        )
-        OLLAMA_AGENTS: Dict[str, str] = Field(
-            default={
-                "tutor": "ollama/phi3:3.8b",
-                "coach": "ollama/gemma:2b",
-                "analyst": "ollama/qwen:1.8b",
-                "synthesizer": "ollama/phi3:3.8b",
-            }
-        )
+    Parsed exactly once per process; real environment variables win over
+    .env entries, matching the previous pydantic BaseSettings behavior.
+    """
+    values: Dict[str, str] = {}
+    env_file = _ROOT / ".env"
+    if env_file.exists():
+        for line in env_file.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            values[key.strip().upper()] = value.strip()
+    for key, value in os.environ.items():
+        values[key.upper()] = value
+    return values
 
-        # Retrieval configuration
-        TOP_K_DOCUMENTS: int = Field(default=4, env="TOP_K_DOCUMENTS")
-        DISTANCE_THRESHOLD: float = Field(default=1.2, env="DISTANCE_THRESHOLD")
-        MMR_DIVERSITY_FACTOR: float = Field(default=0.7, env="MMR_DIVERSITY_FACTOR")
-        SEARCH_METHOD: str = Field(default="smart", env="SEARCH_METHOD")
 
-        # Upload configuration
-        UPLOAD_DIR: Path = Field(
-            default_factory=lambda: Path(__file__).parent.parent / "data" / "raw"
-        )
-        ALLOWED_EXTENSIONS: List[str] = Field(default=[".pdf", ".txt", ".docx"])
-        MAX_FILE_SIZE: int = Field(
-            default=50 * 1024 * 1024, env="MAX_FILE_SIZE"
-        )  # 50MB
-
-        # API configuration
-        API_HOST: str = Field(default="127.0.0.1", env="API_HOST")
-        API_PORT: int = Field(default=8005, env="API_PORT")
-        API_WORKERS: int = Field(default=1, env="API_WORKERS")
-
-        # Logging configuration
-        LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
-        LOG_FORMAT: str = Field(
-            default="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+def _env_str(name: str, default: str) -> str:
+    return _env().get(name, default)
 
-        # Security configuration
-        CORS_ORIGINS: List[str] = Field(
-            default=["http://localhost:3000"], env="CORS_ORIGINS"
-        )
-        API_KEY: str = Field(default="", env="API_KEY")
 
-        @validator(
-            "PROJECT_ROOT", "DATA_DIR", "VECTORSTORE_DIR", "LOGS_DIR", "UPLOAD_DIR"
+def _env_int(name: str, default: int) -> int:
+    return int(_env().get(name, default))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(_env().get(name, default))
+
+
+def _env_list(name: str, default: List[str]) -> List[str]:
+    raw = _env().get(name)
+    if raw is None:
+        return list(default)
+    return [item.strip() for item in raw.split(",") if item.strip()]
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Application settings, resolved once from the environment.
+
+    A frozen dataclass with plain os.environ reads replaces the previous
+    pydantic BaseSettings: for ~20 scalar fields the reflective validator
+    machinery cost more than the parsing it guarded, and the pydantic v1
+    import no longer resolves on modern installs anyway.
+    """
+
+    # Project paths
+    PROJECT_ROOT: Path = _ROOT
+    DATA_DIR: Path = _ROOT / "data"
+    VECTORSTORE_DIR: Path = _ROOT / "vectorstore"
+    LOGS_DIR: Path = _ROOT / "logs"
+    UPLOAD_DIR: Path = _ROOT / "data" / "raw"
+
+    # Embedding configuration
+    EMBEDDING_MODEL: str = field(
+        default_factory=lambda: _env_str("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    )
+    # Optional int8-quantized ONNX export of the embedding model;
+    # empty string keeps the default sentence-transformers backend
+    EMBEDDING_ONNX_PATH: str = field(
+        default_factory=lambda: _env_str("EMBEDDING_ONNX_PATH", "")
+    )
+    CHUNK_SIZE: int = field(default_factory=lambda: _env_int("CHUNK_SIZE", 1000))
+    CHUNK_OVERLAP: int = field(default_factory=lambda: _env_int("CHUNK_OVERLAP", 200))
+
+    # Agent configuration
+    OLLAMA_BASE_URL: str = field(
+        default_factory=lambda: _env_str("OLLAMA_BASE_URL", "http://localhost:11434")
+    )
+    OLLAMA_AGENTS: Dict[str, str] = field(
+        default_factory=lambda: {
+            "tutor": "ollama/phi3:3.8b",
+            "coach": "ollama/gemma:2b",
+            "analyst": "ollama/qwen:1.8b",
+            "synthesizer": "ollama/phi3:3.8b",
+        }
+    )
+
+    # Retrieval configuration
+    TOP_K_DOCUMENTS: int = field(default_factory=lambda: _env_int("TOP_K_DOCUMENTS", 4))
+    DISTANCE_THRESHOLD: float = field(
+        default_factory=lambda: _env_float("DISTANCE_THRESHOLD", 1.2)
+    )
+    MMR_DIVERSITY_FACTOR: float = field(
+        default_factory=lambda: _env_float("MMR_DIVERSITY_FACTOR", 0.7)
+    )
+    SEARCH_METHOD: str = field(
+        default_factory=lambda: _env_str("SEARCH_METHOD", "smart")
+    )
+
+    # Upload configuration
+    ALLOWED_EXTENSIONS: List[str] = field(
+        default_factory=lambda: [".pdf", ".txt", ".docx"]
+    )
+    MAX_FILE_SIZE: int = field(
+        default_factory=lambda: _env_int("MAX_FILE_SIZE", 50 * 1024 * 1024)
+    )  # 50MB
+
+    # API configuration
+    API_HOST: str = field(default_factory=lambda: _env_str("API_HOST", "127.0.0.1"))
+    API_PORT: int = field(default_factory=lambda: _env_int("API_PORT", 8005))
+    API_WORKERS: int = field(default_factory=lambda: _env_int("API_WORKERS", 1))
+
+    # Logging configuration
+    LOG_LEVEL: str = field(default_factory=lambda: _env_str("LOG_LEVEL", "INFO"))
+    LOG_FORMAT: str = field(
+        default_factory=lambda: _env_str(
+            "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
-        def create_directories(cls, v):
-            """Ensure directories exist"""
-            v.mkdir(parents=True, exist_ok=True)
-            return v
-
-        @validator("CHUNK_SIZE", "CHUNK_OVERLAP")
-        def validate_chunk_settings(cls, v, values):
-            """Validate chunk settings"""
-            if "CHUNK_SIZE" in values and v >= values["CHUNK_SIZE"]:
-                raise ValueError("CHUNK_OVERLAP must be less than CHUNK_SIZE")
-            return v
-
-        @validator("MMR_DIVERSITY_FACTOR")
-        def validate_mmr_factor(cls, v):
-            """Validate MMR diversity factor"""
-            if not 0 <= v <= 1:
-                raise ValueError("MMR_DIVERSITY_FACTOR must be between 0 and 1")
-            return v
-
-        @validator("SEARCH_METHOD")
-        def validate_search_method(cls, v):
-            """Validate search method"""
-            valid_methods = ["similarity", "mmr", "smart", "detailed"]
-            if v not in valid_methods:
-                raise ValueError(f"SEARCH_METHOD must be one of: {valid_methods}")
-            return v
-
-        class Config:
-            env_file = ".env"
-            env_file_encoding = "utf-8"
-            case_sensitive = False
-
-    # Create settings instance
+    )
+
+    # Security configuration
+    CORS_ORIGINS: List[str] = field(
+        default_factory=lambda: _env_list("CORS_ORIGINS", ["http://localhost:3000"])
+    )
+    API_KEY: str = field(default_factory=lambda: _env_str("API_KEY", ""))
+
+    def __post_init__(self):
+        """Validate settings once at construction"""
+        if self.CHUNK_OVERLAP >= self.CHUNK_SIZE:
+            raise ValueError("CHUNK_OVERLAP must be less than CHUNK_SIZE")
+        if not 0 <= self.MMR_DIVERSITY_FACTOR <= 1:
+            raise ValueError("MMR_DIVERSITY_FACTOR must be between 0 and 1")
+        if self.SEARCH_METHOD not in _VALID_SEARCH_METHODS:
+            raise ValueError(
+                f"SEARCH_METHOD must be one of: {list(_VALID_SEARCH_METHODS)}"
+            )
+
+
+# Directories already created by this process; avoids repeating the
+# mkdir (and its hidden stat) on every get_settings()-driven access
+_created_dirs: set = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory once per process, skipping repeat syscalls"""
+    if path in _created_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _created_dirs.add(path)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the shared, validated Settings instance.
+
+    The lru_cache makes this a process-wide singleton: the .env parsing and
+    validation run once instead of on every import or worker start.
+    Directory creation happens here (once) rather than per instantiation.
+    """
     settings = Settings()
+    for directory in (
+        settings.PROJECT_ROOT,
+        settings.DATA_DIR,
+        settings.VECTORSTORE_DIR,
+        settings.LOGS_DIR,
+        settings.UPLOAD_DIR,
+    ):
+        _ensure_dir(directory)
+    return settings
+
 
-except ImportError:
-    # Fallback to simple configuration if pydantic-settings is not available
-    print("Warning: pydantic-settings not available, using fallback configuration")
-
-    # Simple fallback configuration
-    PROJECT_ROOT = Path(__file__).parent.parent
-    DATA_DIR = PROJECT_ROOT / "data"
-    VECTORSTORE_DIR = PROJECT_ROOT / "vectorstore"
-    LOGS_DIR = PROJECT_ROOT / "logs"
-    UPLOAD_DIR = DATA_DIR / "raw"
-
-    # Ensure directories exist
-    VECTORSTORE_DIR.mkdir(parents=True, exist_ok=True)
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
-
-    # Default values
-    EMBEDDING_MODEL = "all-MiniLM-L6-v2"
-    CHUNK_SIZE = 1000
-    CHUNK_OVERLAP = 200
-    OLLAMA_AGENTS = {
-        "tutor": "ollama/phi3:3.8b",
-        "coach": "ollama/gemma:2b",
-        "analyst": "ollama/qwen:1.8b",
-        "synthesizer": "ollama/phi3:3.8b",
+# Names resolved lazily from the settings singleton (PEP 562)
+_SETTING_EXPORTS = frozenset(
+    {
+        "PROJECT_ROOT",
+        "DATA_DIR",
+        "VECTORSTORE_DIR",
+        "LOGS_DIR",
+        "UPLOAD_DIR",
+        "EMBEDDING_MODEL",
+        "EMBEDDING_ONNX_PATH",
+        "CHUNK_SIZE",
+        "CHUNK_OVERLAP",
+        "OLLAMA_BASE_URL",
+        "OLLAMA_AGENTS",
+        "TOP_K_DOCUMENTS",
+        "ALLOWED_EXTENSIONS",
+        "MAX_FILE_SIZE",
+        "DISTANCE_THRESHOLD",
+        "MMR_DIVERSITY_FACTOR",
+        "SEARCH_METHOD",
+        "API_HOST",
+        "API_PORT",
+        "API_WORKERS",
+        "LOG_LEVEL",
+        "LOG_FORMAT",
+        "CORS_ORIGINS",
+        "API_KEY",
     }
-    TOP_K_DOCUMENTS = 4
-    ALLOWED_EXTENSIONS = [".pdf", ".txt", ".docx"]
-    MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
-    DISTANCE_THRESHOLD = 1.2
-    MMR_DIVERSITY_FACTOR = 0.7
-    SEARCH_METHOD = "smart"
-
-    # Create a simple settings object for compatibility
-    class SimpleSettings:
-        def __init__(self):
-            self.PROJECT_ROOT = PROJECT_ROOT
-            self.DATA_DIR = DATA_DIR
-            self.VECTORSTORE_DIR = VECTORSTORE_DIR
-            self.LOGS_DIR = LOGS_DIR
-            self.UPLOAD_DIR = UPLOAD_DIR
-            self.EMBEDDING_MODEL = EMBEDDING_MODEL
-            self.CHUNK_SIZE = CHUNK_SIZE
-            self.CHUNK_OVERLAP = CHUNK_OVERLAP
-            self.OLLAMA_AGENTS = OLLAMA_AGENTS
-            self.TOP_K_DOCUMENTS = TOP_K_DOCUMENTS
-            self.ALLOWED_EXTENSIONS = ALLOWED_EXTENSIONS
-            self.MAX_FILE_SIZE = MAX_FILE_SIZE
-            self.DISTANCE_THRESHOLD = DISTANCE_THRESHOLD
-            self.MMR_DIVERSITY_FACTOR = MMR_DIVERSITY_FACTOR
-            self.SEARCH_METHOD = SEARCH_METHOD
-            self.LOG_LEVEL = "INFO"
-            self.LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-    settings = SimpleSettings()
-
-# Backward compatibility exports
-PROJECT_ROOT = settings.PROJECT_ROOT
-DATA_DIR = settings.DATA_DIR
-VECTORSTORE_DIR = settings.VECTORSTORE_DIR
-UPLOAD_DIR = settings.UPLOAD_DIR
-EMBEDDING_MODEL = settings.EMBEDDING_MODEL
-CHUNK_SIZE = settings.CHUNK_SIZE
-CHUNK_OVERLAP = settings.CHUNK_OVERLAP
-OLLAMA_AGENTS = settings.OLLAMA_AGENTS
-TOP_K_DOCUMENTS = settings.TOP_K_DOCUMENTS
-ALLOWED_EXTENSIONS = settings.ALLOWED_EXTENSIONS
-MAX_FILE_SIZE = settings.MAX_FILE_SIZE
-DISTANCE_THRESHOLD = settings.DISTANCE_THRESHOLD
-MMR_DIVERSITY_FACTOR = settings.MMR_DIVERSITY_FACTOR
-SEARCH_METHOD = settings.SEARCH_METHOD
+)
+
+
+@lru_cache(maxsize=1)
+def _allowed_extensions_set() -> frozenset:
+    """Lowercased ALLOWED_EXTENSIONS as a frozenset for O(1) membership tests"""
+    return frozenset(ext.lower() for ext in get_settings().ALLOWED_EXTENSIONS)
+
 
+def __getattr__(name: str):
+    """Backward compatibility exports, fetched lazily from the singleton"""
+    if name == "settings":
+        return get_settings()
+    if name == "ALLOWED_EXTENSIONS_SET":
+        return _allowed_extensions_set()
+    if name in _SETTING_EXPORTS:
+        return getattr(get_settings(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
+
+@lru_cache(maxsize=512)
 def get_vectorstore_path(document_name: str) -> Path:
-    """Get the vector store path for a specific document"""
+    """Get the vector store path for a specific document.
+
+    Memoized: the same document names are looked up for every ingest and
+    every question, so repeated calls skip the Path parsing and
+    concatenation entirely.
+    """
     store_name = f"{Path(document_name).stem}_faiss_index"
-    return VECTORSTORE_DIR / store_name
+    return get_settings().VECTORSTORE_DIR / store_name
+
+
+# (directory mtime, store paths) from the last scan; a stale mtime
+# invalidates the cache so new stores show up on the next call
+_vectorstore_cache: Optional[Tuple[float, List[Path]]] = None
 
 
 def list_available_vectorstores() -> List[Path]:
-    """List all available vector stores"""
-    return list(VECTORSTORE_DIR.glob("*_faiss_index"))
+    """List all available vector stores.
+
+    Uses a single os.scandir pass cached by the directory's mtime, so
+    repeated calls (every QA turn, every API request) are O(1) until a
+    store is added or removed.
+    """
+    global _vectorstore_cache
+    vectorstore_dir = get_settings().VECTORSTORE_DIR
+    try:
+        mtime = vectorstore_dir.stat().st_mtime
+    except OSError:
+        return []
+    if _vectorstore_cache is not None and _vectorstore_cache[0] == mtime:
+        return _vectorstore_cache[1]
+    stores = sorted(
+        Path(entry.path)
+        for entry in os.scandir(vectorstore_dir)
+        if entry.name.endswith("_faiss_index") and entry.is_dir(follow_symlinks=False)
+    )
+    _vectorstore_cache = (mtime, stores)
+    return stores
@@ -2,6 +2,9 @@ from config.settings import OLLAMA_AGENTS
 
 from .base_agent import BaseStudentAgent
 
+# Resolved once at import time; avoids a settings + dict lookup per construction
+_MODEL = OLLAMA_AGENTS["analyst"]
+
 
 class AnalystAgent(BaseStudentAgent):
     def __init__(self):
@@ -14,5 +17,5 @@ class AnalystAgent(BaseStudentAgent):
             backstory=(
                 "An analytical thinker highlighting nuances and deeper context."
             ),
-            llm_model=OLLAMA_AGENTS["analyst"],
+            llm_model=_MODEL,
         )
@@ -2,6 +2,9 @@ from config.settings import OLLAMA_AGENTS
 
 from .base_agent import BaseStudentAgent
 
+# Resolved once at import time; avoids a settings + dict lookup per construction
+_MODEL = OLLAMA_AGENTS["coach"]
+
 
 class CoachAgent(BaseStudentAgent):
     def __init__(self):
@@ -12,5 +15,5 @@ class CoachAgent(BaseStudentAgent):
                 "using provided context."
             ),
             backstory="A motivational coach who helps learning feel fun and inspiring.",
-            llm_model=OLLAMA_AGENTS["coach"],
+            llm_model=_MODEL,
         )
@@ -2,6 +2,9 @@ from config.settings import OLLAMA_AGENTS
 
 from .base_agent import BaseStudentAgent
 
+# Resolved once at import time; avoids a settings + dict lookup per construction
+_MODEL = OLLAMA_AGENTS["synthesizer"]
+
 
 class SynthesizerAgent(BaseStudentAgent):
     def __init__(self):
@@ -16,5 +19,5 @@ class SynthesizerAgent(BaseStudentAgent):
                 "You specialize in combining information from multiple perspectives, "
                 "eliminating overlap and providing clear, user-friendly summaries."
             ),
-            llm_model=OLLAMA_AGENTS["synthesizer"],
+            llm_model=_MODEL,
         )
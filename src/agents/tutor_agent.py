@@ -2,6 +2,9 @@ from config.settings import OLLAMA_AGENTS
 
 from .base_agent import BaseStudentAgent
 
+# Resolved once at import time; avoids a settings + dict lookup per construction
+_MODEL = OLLAMA_AGENTS["tutor"]
+
 
 class TutorAgent(BaseStudentAgent):
     def __init__(self):
@@ -12,5 +15,5 @@ class TutorAgent(BaseStudentAgent):
                 "using provided context."
             ),
             backstory="A patient tutor who focuses on basics and clear examples.",
-            llm_model=OLLAMA_AGENTS["tutor"],
+            llm_model=_MODEL,
         )
@@ -1,9 +1,10 @@
 from pathlib import Path
-from typing import List
+from typing import ClassVar, FrozenSet, List
 
 from langchain_community.document_loaders import Docx2txtLoader, PyPDFLoader, TextLoader
 from langchain_core.documents import Document
 
+from config.settings import ALLOWED_EXTENSIONS_SET
 from src.utils import get_logger
 from src.utils.exceptions import DocumentProcessingError, ValidationError
 
@@ -13,8 +14,10 @@ logger = get_logger(__name__)
 class DocumentLoader:
     """Document loader with enhanced error handling and validation"""
 
+    # Shared frozenset from settings: O(1) membership checks, built once
+    supported_extensions: ClassVar[FrozenSet[str]] = ALLOWED_EXTENSIONS_SET
+
     def __init__(self):
-        self.supported_extensions = {".pdf", ".docx", ".txt"}
         logger.info("DocumentLoader initialized")
 
     def load(self, file_path: str) -> List[Document]:
@@ -1,3 +1,9 @@
+import asyncio
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from cachetools import TTLCache
 from crewai import Crew
 
 from src.agents.analyst_agent import AnalystAgent
@@ -6,10 +12,22 @@ from src.agents.synthesizer_agent import SynthesizerAgent
 from src.agents.tutor_agent import TutorAgent
 from src.tasks.learning_tasks import build_expert_task, build_synthesis_task
 
+# Expert outputs are deterministic for a given (role, prompt) at our
+# settings, so repeated questions over the same context skip the LLM
+# round-trip entirely. TTL keeps entries from outliving model updates;
+# the lock covers concurrent access from the expert fan-out threads.
+_TASK_CACHE = TTLCache(maxsize=2048, ttl=3600)
+_TASK_CACHE_LOCK = threading.Lock()
+
 
 class StudentLearningCrew:
+    # One thread per expert task; kickoff blocks on HTTP so threads suffice
+    _EXPERT_WORKERS = 3
+
     def __init__(self, retriever):
         self.retriever = retriever
+        # Long-lived pool shared by every question handled by this crew
+        self._executor = ThreadPoolExecutor(max_workers=self._EXPERT_WORKERS)
 
         # Initialize agents
         print("🤖 Initializing agents...")
@@ -31,28 +49,40 @@ class StudentLearningCrew:
             print(f"❌ Agent initialization failed: {e}")
             raise
 
+    def close(self):
+        """Release the expert worker threads.
+
+        Evicted crews are otherwise collected without ever stopping the
+        pool, leaking threads on every delete/re-upload cycle. The crew
+        must not be used after closing.
+        """
+        self._executor.shutdown(wait=False)
+
     def process_question(self, question):
-        # FIXED: Use distance_threshold instead of similarity_threshold
-        context = self.retriever.get_context(question, top_k=4)
+        # Retrieval (embedding forward pass + FAISS scan) is independent of
+        # the scaffolding below, so it runs on the pool while this thread
+        # lines up the expert assignments; .result() re-raises any
+        # retrieval error exactly where the old call would have
+        context_future = self._executor.submit(self.retriever.get_context, question, 4)
 
-        # Create tasks
-        task1 = build_expert_task(
-            self.tutor, "Provide a clear, foundational explanation", context, question
-        )
-        task2 = build_expert_task(
-            self.coach, "Explain with analogies and encouragement", context, question
-        )
-        task3 = build_expert_task(
-            self.analyst, "Provide deeper insights and analysis", context, question
-        )
+        assignments = [
+            (self.tutor, "Provide a clear, foundational explanation"),
+            (self.coach, "Explain with analogies and encouragement"),
+            (self.analyst, "Provide deeper insights and analysis"),
+        ]
+        context = context_future.result()
 
-        expert_tasks = [task1, task2, task3]
+        expert_tasks = [
+            build_expert_task(agent, description, context, question)
+            for agent, description in assignments
+        ]
         expert_outputs = {}
 
-        # Run sequentially to avoid memory issues
-        for i, task in enumerate(expert_tasks, 1):
-            print(f"🤖 Running Expert {i}/3...")
-            role, answer = self._run_task(task)
+        # The three expert calls are independent LLM round-trips against the
+        # Ollama server (which serves requests concurrently), so fanning
+        # them out drops wall time from T1+T2+T3 to ~max(T1,T2,T3)
+        print(f"🤖 Running {len(expert_tasks)} experts concurrently...")
+        for role, answer in self._executor.map(self._run_task, expert_tasks):
             expert_outputs[role] = answer
             print(f"✅ {role} completed")
 
@@ -70,8 +100,69 @@ class StudentLearningCrew:
             "final_answer": str(final_answer),
         }
 
+    async def stream_process_question(self, question):
+        """Yield each expert's answer as it finishes, then the synthesis.
+
+        Async-generator counterpart of process_question: instead of
+        blocking until every phase completes, callers (e.g. an SSE
+        endpoint) receive a {"context"} dict once retrieval finishes,
+        then {"role", "answer"} dicts the moment each expert returns, and
+        synthesis starts as soon as the last one lands.
+        """
+        loop = asyncio.get_running_loop()
+        context = await loop.run_in_executor(
+            self._executor, self.retriever.get_context, question, 4
+        )
+        yield {"context": context}
+
+        expert_tasks = [
+            build_expert_task(
+                self.tutor,
+                "Provide a clear, foundational explanation",
+                context,
+                question,
+            ),
+            build_expert_task(
+                self.coach,
+                "Explain with analogies and encouragement",
+                context,
+                question,
+            ),
+            build_expert_task(
+                self.analyst, "Provide deeper insights and analysis", context, question
+            ),
+        ]
+
+        expert_outputs = {}
+        futures = [
+            loop.run_in_executor(self._executor, self._run_task, task)
+            for task in expert_tasks
+        ]
+        for future in asyncio.as_completed(futures):
+            role, answer = await future
+            expert_outputs[role] = answer
+            yield {"role": role, "answer": answer}
+
+        combined = "\n\n".join(expert_outputs.values())
+        synth_task = build_synthesis_task(self.synthesizer, combined)
+        _, final_answer = await loop.run_in_executor(
+            self._executor, self._run_task, synth_task
+        )
+        yield {"final_answer": final_answer}
+
     @staticmethod
     def _run_task(task):
+        # The description embeds the context and question, so its hash
+        # (plus the role) uniquely keys the expert's answer
+        role = task.agent.role
+        key = (role, hashlib.sha256(task.description.encode()).digest())
+        with _TASK_CACHE_LOCK:
+            cached = _TASK_CACHE.get(key)
+        if cached is not None:
+            return (role, cached)
+
         temp_crew = Crew(agents=[task.agent], tasks=[task], verbose=False)
-        result = temp_crew.kickoff()
-        return (task.agent.role, str(result))
+        result = str(temp_crew.kickoff())
+        with _TASK_CACHE_LOCK:
+            _TASK_CACHE[key] = result
+        return (role, result)
@@ -0,0 +1,90 @@
+import threading
+import time
+import zlib
+
+import numpy as np
+
+
+class SemanticAnswerCache:
+    """Answer cache keyed by question-embedding similarity.
+
+    Reworded versions of the same question embed close together, so a
+    cosine match at or above the threshold returns the stored answer
+    without running the multi-agent pipeline. Embeddings are
+    L2-normalized and searched in a FAISS inner-product index, making a
+    hit a sub-millisecond lookup. Entries expire after ttl seconds and
+    the oldest record is evicted once max_records is reached.
+
+    Lookups may run on worker threads while inserts happen on the event
+    loop, and FAISS does not allow searching an index that is being
+    mutated, so all index and record access serializes through a lock;
+    embedding and (de)compression stay outside it.
+    """
+
+    def __init__(self, embed_fn, threshold=0.92, ttl=300.0, max_records=256):
+        import faiss
+
+        self._faiss = faiss
+        self._embed = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_records = max_records
+        self._lock = threading.Lock()
+        self._index = None  # built lazily once the embedding dim is known
+        self._records = {}  # id -> (timestamp, answer dict)
+        self._next_id = 0
+
+    def _normalize(self, question):
+        query = np.asarray(self._embed(question), dtype=np.float32)[None, :]
+        self._faiss.normalize_L2(query)
+        return query
+
+    def get(self, question):
+        """Return the cached answer for a semantically similar question."""
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None
+        query = self._normalize(question)
+        with self._lock:
+            scores, ids = self._index.search(query, 1)
+            best_id = int(ids[0][0])
+            if best_id == -1 or float(scores[0][0]) < self.threshold:
+                return None
+            record = self._records.get(best_id)
+            if record is None:
+                return None
+            stamp, answer = record
+            if time.time() - stamp > self.ttl:
+                self._remove(best_id)
+                return None
+            answer = dict(answer)
+        context = answer.get("context")
+        if isinstance(context, bytes):
+            answer["context"] = zlib.decompress(context).decode("utf-8")
+        return answer
+
+    def put(self, question, answer):
+        """Store an answer under the question's normalized embedding."""
+        query = self._normalize(question)
+        # The retrieved context dominates entry size and is natural text,
+        # so it sits compressed in RAM and is inflated lazily on a hit
+        stored = dict(answer)
+        context = stored.get("context")
+        if isinstance(context, str):
+            stored["context"] = zlib.compress(context.encode("utf-8"))
+        with self._lock:
+            if self._index is None:
+                self._index = self._faiss.IndexIDMap2(
+                    self._faiss.IndexFlatIP(query.shape[1])
+                )
+            if len(self._records) >= self.max_records:
+                oldest = min(self._records, key=lambda rid: self._records[rid][0])
+                self._remove(oldest)
+            self._index.add_with_ids(query, np.array([self._next_id], dtype=np.int64))
+            self._records[self._next_id] = (time.time(), stored)
+            self._next_id += 1
+
+    def _remove(self, record_id):
+        # Caller holds self._lock
+        self._records.pop(record_id, None)
+        self._index.remove_ids(np.array([record_id], dtype=np.int64))
@@ -1,87 +1,221 @@
-import math
+import logging
+from functools import lru_cache
 
-from langchain_community.vectorstores import FAISS
+import numpy as np
 from langchain_huggingface import HuggingFaceEmbeddings
 
 from config.settings import EMBEDDING_MODEL, TOP_K_DOCUMENTS
+from src.ingestion.vector_store import load_vector_store
+from src.utils import retrieval_logger
+
+# Distance cutoffs and labels for the relevance ladders; searchsorted
+# (side="right") reproduces the original strict-< comparisons. get_context
+# and smart_search use different cutoffs but share the label tuple.
+_RELEVANCE_CUTS = np.array([1.0, 1.2, 1.5], dtype=np.float32)
+_SMART_CUTS = np.array([0.2, 0.5, 1.0], dtype=np.float32)
+_RELEVANCE_LABELS = (
+    "🎯 Highly Relevant",
+    "✅ Relevant",
+    "⚠️ Somewhat Relevant",
+    "❓ Possibly Relevant",
+)
+
+
+@lru_cache(maxsize=4)
+def _get_embedder(model_name=EMBEDDING_MODEL):
+    """Shared embedder per model name; loading weights is a multi-second,
+    multi-hundred-MB operation, so every retriever reuses one instance"""
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        encode_kwargs={"batch_size": 64},
+    )
+
+
+@lru_cache(maxsize=1024)
+def _embed_query(query: str) -> tuple:
+    """Embed a query string, cached so repeat queries skip the transformer
+    forward pass entirely (stored as a tuple to stay hashable/immutable)"""
+    return tuple(_get_embedder().embed_query(query))
 
 
 class ContextRetriever:
+    # Below this many vectors an exhaustive flat scan beats paying the
+    # HNSW graph construction cost
+    _HNSW_THRESHOLD = 10_000
+
     def __init__(self, vector_store_path):
         self.vector_store_path = vector_store_path
-        self.embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
-        self.vector_store = FAISS.load_local(
-            self.vector_store_path,
-            self.embeddings,
-            allow_dangerous_deserialization=True,
-        )
+        self.embeddings = _get_embedder()
+        # Memoized per path: repeat retrievers for the same document reuse
+        # the already-deserialized index
+        self.vector_store = load_vector_store(self.vector_store_path)
+        self._maybe_upgrade_index()
+
+    def _maybe_upgrade_index(self):
+        """Swap a large exhaustive flat index for HNSW at load time.
+
+        IndexFlatL2 scans all N vectors per query; past the threshold an
+        HNSW graph answers in roughly logarithmic time with minimal recall
+        loss. The upgrade is in-memory only — the on-disk store stays flat
+        — and the shared cached handle means it happens once per process.
+        """
+        try:
+            import faiss
+        except ImportError:
+            return
+        index = self.vector_store.index
+        if (
+            not isinstance(index, faiss.IndexFlatL2)
+            or index.ntotal < self._HNSW_THRESHOLD
+        ):
+            return
+        vectors = index.reconstruct_n(0, index.ntotal)
+        new_index = faiss.IndexHNSWFlat(index.d, 32)
+        new_index.hnsw.efConstruction = 200
+        new_index.hnsw.efSearch = 64
+        new_index.add(vectors)
+        self.vector_store.index = new_index
+
+    @staticmethod
+    def _embed(query):
+        """Cached query embedding as a mutable list for FAISS calls"""
+        return list(_embed_query(query))
 
     def get_context(self, query, top_k=TOP_K_DOCUMENTS):
         """
         Smart similarity search that adapts to your data distribution
         """
-        results_with_scores = self.vector_store.similarity_search_with_score(
-            query, k=top_k
+        results_with_scores = self.vector_store.similarity_search_with_score_by_vector(
+            self._embed(query), k=top_k
         )
 
-        print(f"🔍 Similarity search for: '{query}'")
-        print("=" * 50)
-
-        # Calculate dynamic threshold based on your data
-        if results_with_scores:
-            distances = [abs(score) for _, score in results_with_scores]
-            avg_distance = sum(distances) / len(distances)
+        relevant_docs = [doc for doc, _ in results_with_scores]
+
+        # Diagnostics are debug-only: the isEnabledFor guard skips all the
+        # f-string formatting (and its stdout syscalls) on the hot path
+        if results_with_scores and retrieval_logger.isEnabledFor(logging.DEBUG):
+            retrieval_logger.debug("🔍 Similarity search for: '%s'", query)
+            # One SIMD pass over all scores instead of per-element Python math
+            distances = np.abs(
+                np.fromiter(
+                    (score for _, score in results_with_scores),
+                    dtype=np.float32,
+                    count=len(results_with_scores),
+                )
+            )
+            avg_distance = float(distances.mean())
             dynamic_threshold = avg_distance + 0.3  # Allow slightly above average
 
-            print(f"📊 Distance range: {min(distances):.3f} - {max(distances):.3f}")
-            print(f"📊 Average distance: {avg_distance:.3f}")
-            print(f"📊 Dynamic threshold: {dynamic_threshold:.3f}")
-
-        relevant_docs = []
-        for i, (doc, distance) in enumerate(results_with_scores, 1):
-            abs_distance = abs(distance)
-
-            # Determine relevance level
-            if abs_distance < 1.0:
-                relevance = "🎯 Highly Relevant"
-            elif abs_distance < 1.2:
-                relevance = "✅ Relevant"
-            elif abs_distance < 1.5:
-                relevance = "⚠️ Somewhat Relevant"
-            else:
-                relevance = "❓ Possibly Relevant"
-
-            print(f"{i}. {relevance} (distance: {distance:.3f})")
-            print(f"   Content: {doc.page_content[:100]}...")
-            print("-" * 40)
-
-            relevant_docs.append(doc)
-
-        print(
-            f"✅ Returning all {len(relevant_docs)} documents - "
-            f"let AI agents decide relevance"
+            retrieval_logger.debug(
+                "📊 Distance range: %.3f - %.3f", distances.min(), distances.max()
+            )
+            retrieval_logger.debug("📊 Average distance: %.3f", avg_distance)
+            retrieval_logger.debug("📊 Dynamic threshold: %.3f", dynamic_threshold)
+
+            # Bucket all distances at once; labels come from the shared tuple
+            buckets = np.searchsorted(_RELEVANCE_CUTS, distances, side="right")
+            for i, ((doc, distance), bucket) in enumerate(
+                zip(results_with_scores, buckets), 1
+            ):
+                retrieval_logger.debug(
+                    "%d. %s (distance: %.3f)", i, _RELEVANCE_LABELS[bucket], distance
+                )
+                retrieval_logger.debug("   Content: %s...", doc.page_content[:100])
+
+        retrieval_logger.debug(
+            "✅ Returning all %d documents - let AI agents decide relevance",
+            len(relevant_docs),
         )
 
-        context = "\n\n".join([doc.page_content for doc in relevant_docs])
+        context = "\n\n".join(doc.page_content for doc in relevant_docs)
         return context
 
+    def get_contexts_batch(self, queries, top_k=TOP_K_DOCUMENTS):
+        """
+        Retrieve contexts for many queries in one FAISS search call.
+
+        Embedding all queries in a single encoder pass and searching them
+        as one matrix turns N vector-at-a-time scans into a single batched
+        matrix multiply, which is the fast path for evaluation datasets
+        and multi-query retrieval.
+        """
+        if not queries:
+            return []
+        vecs = self.embeddings.embed_documents(list(queries))
+        xq = np.asarray(vecs, dtype=np.float32)
+        _, indices = self.vector_store.index.search(xq, top_k)
+
+        docstore = self.vector_store.docstore
+        index_to_docstore_id = self.vector_store.index_to_docstore_id
+        contexts = []
+        for row in indices:
+            pieces = []
+            for idx in row:
+                if idx == -1:  # FAISS pads short result rows with -1
+                    continue
+                doc = docstore.search(index_to_docstore_id[int(idx)])
+                pieces.append(doc.page_content)
+            contexts.append("\n\n".join(pieces))
+        return contexts
+
+    def _mmr_numpy(self, query, top_k, lambda_mult):
+        """FAISS-native MMR: one batched search plus a matrix re-rank.
+
+        LangChain's MMR re-ranks candidates with one Python-level vector
+        op per pair; here the pairwise similarities come from a single
+        candidate-matrix GEMM and the greedy selection runs on NumPy
+        arrays.
+        """
+        index = self.vector_store.index
+        xq = np.asarray(self._embed(query), dtype=np.float32)
+        fetch_k = min(top_k * 2, index.ntotal)
+        _, indices = index.search(xq[None, :], fetch_k)
+        candidates = [int(i) for i in indices[0] if i != -1]
+        if not candidates:
+            return []
+
+        xb = np.stack([index.reconstruct(i) for i in candidates])
+        relevance = xb @ xq
+        pairwise = xb @ xb.T
+
+        selected = [int(np.argmax(relevance))]
+        while len(selected) < min(top_k, len(candidates)):
+            penalty = pairwise[:, selected].max(axis=1)
+            scores = lambda_mult * relevance - (1 - lambda_mult) * penalty
+            scores[selected] = -np.inf
+            selected.append(int(np.argmax(scores)))
+
+        docstore = self.vector_store.docstore
+        index_to_docstore_id = self.vector_store.index_to_docstore_id
+        return [docstore.search(index_to_docstore_id[candidates[i]]) for i in selected]
+
     def get_context_with_mmr(self, query, top_k=TOP_K_DOCUMENTS, diversity_factor=0.5):
         """
         Use Maximum Marginal Relevance for better diversity
         """
         try:
-            docs = self.vector_store.max_marginal_relevance_search(
-                query, k=top_k, fetch_k=top_k * 2, lambda_mult=diversity_factor
-            )
+            try:
+                docs = self._mmr_numpy(query, top_k, diversity_factor)
+            except Exception:
+                # Index types without reconstruct() fall back to the
+                # LangChain implementation
+                docs = self.vector_store.max_marginal_relevance_search_by_vector(
+                    self._embed(query),
+                    k=top_k,
+                    fetch_k=top_k * 2,
+                    lambda_mult=diversity_factor,
+                )
 
-            print(f"🎯 MMR search for: '{query}' (diversity: {diversity_factor})")
-            print(f"✅ Found {len(docs)} diverse documents")
+            retrieval_logger.debug(
+                "🎯 MMR search for: '%s' (diversity: %s)", query, diversity_factor
+            )
+            retrieval_logger.debug("✅ Found %d diverse documents", len(docs))
 
-            context = "\n\n".join([doc.page_content for doc in docs])
+            context = "\n\n".join(doc.page_content for doc in docs)
             return context
 
         except Exception as e:
-            print(f"❌ MMR search failed: {e}")
+            retrieval_logger.warning("❌ MMR search failed: %s", e)
             # Fallback to regular similarity search
             return self.get_context(query, top_k)
 
@@ -90,28 +224,39 @@ class ContextRetriever:
         Detailed semantic search with comprehensive scoring
         """
         try:
-            query_embedding = self.embeddings.embed_query(query)
             results_with_scores = (
-                self.vector_store.similarity_search_by_vector_with_score(
-                    query_embedding, k=top_k
+                self.vector_store.similarity_search_with_score_by_vector(
+                    self._embed(query), k=top_k
                 )
             )
 
-            print(f"🧠 Semantic search results for: '{query}'")
-            print("=" * 60)
+            retrieval_logger.debug("🧠 Semantic search results for: '%s'", query)
+            log_details = retrieval_logger.isEnabledFor(logging.DEBUG)
 
-            context_pieces = []
-            for i, (doc, distance) in enumerate(results_with_scores, 1):
-                abs_distance = abs(distance)
-                similarity_percent = math.exp(-abs_distance) * 100
-
-                print(
-                    f"{i}. Distance: {distance:.4f} | "
-                    f"Similarity: {similarity_percent:.1f}%"
+            # One vectorized exp over all distances instead of a C-call
+            # through the eval loop per result
+            distances = np.abs(
+                np.fromiter(
+                    (score for _, score in results_with_scores),
+                    dtype=np.float32,
+                    count=len(results_with_scores),
                 )
-                print(f"   Content: {doc.page_content[:150]}...")
-                print(f"   Metadata: {doc.metadata}")
-                print("-" * 40)
+            )
+            sims = (np.exp(-distances) * 100).tolist()
+
+            context_pieces = []
+            for i, ((doc, distance), similarity_percent) in enumerate(
+                zip(results_with_scores, sims), 1
+            ):
+                if log_details:
+                    retrieval_logger.debug(
+                        "%d. Distance: %.4f | Similarity: %.1f%%",
+                        i,
+                        distance,
+                        similarity_percent,
+                    )
+                    retrieval_logger.debug("   Content: %s...", doc.page_content[:150])
+                    retrieval_logger.debug("   Metadata: %s", doc.metadata)
 
                 context_pieces.append(
                     f"[Relevance: {similarity_percent:.1f}%]\n{doc.page_content}"
@@ -120,7 +265,7 @@ class ContextRetriever:
             return "\n\n".join(context_pieces)
 
         except Exception as e:
-            print(f"❌ Detailed search failed: {e}")
+            retrieval_logger.warning("❌ Detailed search failed: %s", e)
             return self.get_context(query, top_k)
 
     def get_best_context(self, query, method="similarity", top_k=TOP_K_DOCUMENTS):
@@ -142,35 +287,37 @@ class ContextRetriever:
         """
         Smart search that always returns meaningful results
         """
-        results_with_scores = self.vector_store.similarity_search_with_score(
-            query, k=top_k
+        results_with_scores = self.vector_store.similarity_search_with_score_by_vector(
+            self._embed(query), k=top_k
         )
 
-        print(f"🧠 Smart search for: '{query}'")
-        print("=" * 50)
-
-        for i, (doc, distance) in enumerate(results_with_scores, 1):
-            abs_distance = abs(distance)
-
-            # Determine relevance category
-            if abs_distance < 0.2:
-                relevance = "🎯 Highly Relevant"
-            elif abs_distance < 0.5:
-                relevance = "✅ Relevant"
-            elif abs_distance < 1.0:
-                relevance = "⚠️ Somewhat Relevant"
-            else:
-                relevance = "❓ Possibly Relevant"
-
-            similarity_percent = math.exp(-abs_distance) * 100
-
-            print(
-                f"{i}. {relevance} (distance: {distance:.3f}, "
-                f"similarity: {similarity_percent:.1f}%)"
+        # The per-result banner is purely diagnostic, so the whole loop
+        # (including the exp() calls) is skipped unless DEBUG is on
+        if retrieval_logger.isEnabledFor(logging.DEBUG):
+            retrieval_logger.debug("🧠 Smart search for: '%s'", query)
+            distances = np.abs(
+                np.fromiter(
+                    (score for _, score in results_with_scores),
+                    dtype=np.float32,
+                    count=len(results_with_scores),
+                )
             )
-            print(f"   Content: {doc.page_content[:150]}...")
-            print("-" * 40)
+            sims = (np.exp(-distances) * 100).tolist()
+            buckets = np.searchsorted(_SMART_CUTS, distances, side="right")
+            for i, ((doc, distance), bucket, similarity_percent) in enumerate(
+                zip(results_with_scores, buckets, sims), 1
+            ):
+                relevance = _RELEVANCE_LABELS[bucket]
+
+                retrieval_logger.debug(
+                    "%d. %s (distance: %.3f, similarity: %.1f%%)",
+                    i,
+                    relevance,
+                    distance,
+                    similarity_percent,
+                )
+                retrieval_logger.debug("   Content: %s...", doc.page_content[:150])
 
         # Return all documents - let the AI decide relevance
-        context = "\n\n".join([doc.page_content for doc, _ in results_with_scores])
+        context = "\n\n".join(doc.page_content for doc, _ in results_with_scores)
         return context
@@ -4,6 +4,7 @@ Utility functions for the Student Learning Framework
 
 import logging
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,12 @@ except ImportError:
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# Shared formatter and handler-attach lock: the formatter is immutable so
+# one instance serves every logger, and the lock keeps concurrent
+# setup_logging calls from double-attaching handlers
+_DEFAULT_FORMATTER = logging.Formatter(LOG_FORMAT)
+_LOGGER_LOCK = threading.Lock()
+
 
 def setup_logging(
     name: str, level: Optional[str] = None, log_file: Optional[Path] = None
@@ -35,27 +42,30 @@ def setup_logging(
     """
     logger = logging.getLogger(name)
 
-    # Set level
-    log_level = level or LOG_LEVEL
-    logger.setLevel(getattr(logging, log_level.upper()))
-
-    # Avoid adding handlers multiple times
+    # Fast path: an already-configured logger returns before any level
+    # parsing or formatter work
     if logger.handlers:
         return logger
 
-    # Create formatter
-    formatter = logging.Formatter(LOG_FORMAT)
-
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-
-    # File handler (if specified)
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    with _LOGGER_LOCK:
+        # Re-check under the lock so concurrent callers can't both attach
+        if logger.handlers:
+            return logger
+
+        # Set level
+        log_level = level or LOG_LEVEL
+        logger.setLevel(getattr(logging, log_level.upper()))
+
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(_DEFAULT_FORMATTER)
+        logger.addHandler(console_handler)
+
+        # File handler (if specified)
+        if log_file:
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(_DEFAULT_FORMATTER)
+            logger.addHandler(file_handler)
 
     return logger
 
@@ -0,0 +1,78 @@
+"""
+Tests for the semantic answer cache
+"""
+
+import time
+
+import pytest
+
+# Skip collection cleanly (instead of erroring) on environments without
+# the vector stack installed
+np = pytest.importorskip("numpy")
+pytest.importorskip("faiss")
+
+from src.retrieval.answer_cache import SemanticAnswerCache  # noqa: E402
+
+# Fixed embeddings with known cosine similarities to the base question:
+# "same" is identical (1.0), "close" lands above the 0.92 threshold
+# (~0.995) and "far" below it (~0.894)
+_VECTORS = {
+    "base": [1.0, 0.0, 0.0, 0.0],
+    "same": [1.0, 0.0, 0.0, 0.0],
+    "close": [1.0, 0.1, 0.0, 0.0],
+    "far": [1.0, 0.5, 0.0, 0.0],
+    "other": [0.0, 1.0, 0.0, 0.0],
+    "third": [0.0, 0.0, 1.0, 0.0],
+}
+
+
+def _embed(question):
+    return np.array(_VECTORS[question], dtype=np.float32)
+
+
+class TestSemanticAnswerCache:
+    """Test cases for SemanticAnswerCache"""
+
+    def setup_method(self):
+        """Set up a cache with deterministic embeddings"""
+        self.cache = SemanticAnswerCache(_embed)
+
+    def test_empty_cache_misses(self):
+        """Test that lookups on an empty cache return None"""
+        assert self.cache.get("base") is None
+
+    def test_similar_question_hits(self):
+        """Test that questions above the similarity threshold hit"""
+        self.cache.put("base", {"final_answer": "42"})
+        assert self.cache.get("same")["final_answer"] == "42"
+        assert self.cache.get("close")["final_answer"] == "42"
+
+    def test_dissimilar_question_misses(self):
+        """Test that questions below the similarity threshold miss"""
+        self.cache.put("base", {"final_answer": "42"})
+        assert self.cache.get("far") is None
+        assert self.cache.get("other") is None
+
+    def test_context_round_trips_through_compression(self):
+        """Test that the compressed context is restored verbatim on a hit"""
+        context = "retrieved context " * 50
+        self.cache.put("base", {"final_answer": "42", "context": context})
+        assert self.cache.get("base")["context"] == context
+
+    def test_expired_entry_misses(self):
+        """Test that entries past their TTL are dropped"""
+        cache = SemanticAnswerCache(_embed, ttl=0.05)
+        cache.put("base", {"final_answer": "42"})
+        time.sleep(0.1)
+        assert cache.get("base") is None
+
+    def test_oldest_entry_evicted_at_capacity(self):
+        """Test that reaching max_records evicts the oldest record"""
+        cache = SemanticAnswerCache(_embed, max_records=2)
+        cache.put("base", {"final_answer": "first"})
+        cache.put("other", {"final_answer": "second"})
+        cache.put("third", {"final_answer": "third"})
+
+        assert cache.get("base") is None
+        assert cache.get("other")["final_answer"] == "second"
+        assert cache.get("third")["final_answer"] == "third"
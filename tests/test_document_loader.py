@@ -2,14 +2,18 @@
 Tests for document loader functionality
 """
 
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-from langchain.schema import Document
 
-from src.ingestion.document_loader import DocumentLoader
-from src.utils.exceptions import DocumentProcessingError, ValidationError
+# Skip collection cleanly (instead of erroring) on environments without
+# the heavy langchain stack installed
+Document = pytest.importorskip("langchain.schema").Document
+
+# These pull in the langchain stack, so they must stay under the skip
+# guard above
+from src.ingestion.document_loader import DocumentLoader  # noqa: E402
+from src.utils.exceptions import DocumentProcessingError, ValidationError  # noqa: E402
 
 
 class TestDocumentLoader:
@@ -18,13 +22,6 @@ class TestDocumentLoader:
     def setup_method(self):
         """Set up test fixtures"""
         self.loader = DocumentLoader()
-        self.test_data_dir = Path(__file__).parent / "test_data"
-        self.test_data_dir.mkdir(exist_ok=True)
-
-    def teardown_method(self):
-        """Clean up test fixtures"""
-        # Clean up test files if they exist
-        pass
 
     def test_loader_initialization(self):
         """Test DocumentLoader initialization"""
@@ -35,20 +32,16 @@ class TestDocumentLoader:
         with pytest.raises(ValidationError, match="File not found"):
             self.loader.load("nonexistent_file.pdf")
 
-    def test_load_unsupported_extension(self):
+    def test_load_unsupported_extension(self, tmp_path):
         """Test loading a file with unsupported extension"""
-        # Create a temporary file with unsupported extension
-        test_file = self.test_data_dir / "test.xyz"
+        test_file = tmp_path / "test.xyz"
         test_file.write_text("test content")
 
-        try:
-            with pytest.raises(ValidationError, match="Unsupported file type"):
-                self.loader.load(str(test_file))
-        finally:
-            test_file.unlink()
+        with pytest.raises(ValidationError, match="Unsupported file type"):
+            self.loader.load(str(test_file))
 
     @patch("src.ingestion.document_loader.PyPDFLoader")
-    def test_load_pdf_success(self, mock_pdf_loader):
+    def test_load_pdf_success(self, mock_pdf_loader, tmp_path):
         """Test successful PDF loading"""
         # Mock PDF loader
         mock_loader_instance = Mock()
@@ -59,70 +52,54 @@ class TestDocumentLoader:
         mock_loader_instance.load.return_value = mock_documents
         mock_pdf_loader.return_value = mock_loader_instance
 
-        # Create test PDF file
-        test_file = self.test_data_dir / "test.pdf"
+        test_file = tmp_path / "test.pdf"
         test_file.write_text("fake pdf content")
 
-        try:
-            result = self.loader.load(str(test_file))
-            assert len(result) == 2
-            assert result[0].page_content == "Page 1 content"
-            assert result[1].page_content == "Page 2 content"
-        finally:
-            test_file.unlink()
+        result = self.loader.load(str(test_file))
+        assert len(result) == 2
+        assert result[0].page_content == "Page 1 content"
+        assert result[1].page_content == "Page 2 content"
 
     @patch("src.ingestion.document_loader.PyPDFLoader")
-    def test_load_pdf_failure(self, mock_pdf_loader):
+    def test_load_pdf_failure(self, mock_pdf_loader, tmp_path):
         """Test PDF loading failure"""
         # Mock PDF loader to raise exception
         mock_loader_instance = Mock()
         mock_loader_instance.load.side_effect = Exception("PDF loading failed")
         mock_pdf_loader.return_value = mock_loader_instance
 
-        # Create test PDF file
-        test_file = self.test_data_dir / "test.pdf"
+        test_file = tmp_path / "test.pdf"
         test_file.write_text("fake pdf content")
 
-        try:
-            with pytest.raises(DocumentProcessingError, match="PDF loading failed"):
-                self.loader.load(str(test_file))
-        finally:
-            test_file.unlink()
+        with pytest.raises(DocumentProcessingError, match="PDF loading failed"):
+            self.loader.load(str(test_file))
 
     @patch("src.ingestion.document_loader.PyPDFLoader")
-    def test_load_empty_pdf(self, mock_pdf_loader):
+    def test_load_empty_pdf(self, mock_pdf_loader, tmp_path):
         """Test loading PDF with no content"""
         # Mock PDF loader to return empty documents
         mock_loader_instance = Mock()
         mock_loader_instance.load.return_value = []
         mock_pdf_loader.return_value = mock_loader_instance
 
-        # Create test PDF file
-        test_file = self.test_data_dir / "test.pdf"
+        test_file = tmp_path / "test.pdf"
         test_file.write_text("fake pdf content")
 
-        try:
-            with pytest.raises(DocumentProcessingError, match="No content extracted"):
-                self.loader.load(str(test_file))
-        finally:
-            test_file.unlink()
+        with pytest.raises(DocumentProcessingError, match="No content extracted"):
+            self.loader.load(str(test_file))
 
-    def test_get_document_info(self):
+    def test_get_document_info(self, tmp_path):
         """Test getting document information"""
-        # Create test file
-        test_file = self.test_data_dir / "test.txt"
+        test_file = tmp_path / "test.txt"
         test_content = "This is test content"
         test_file.write_text(test_content)
 
-        try:
-            info = self.loader.get_document_info(str(test_file))
+        info = self.loader.get_document_info(str(test_file))
 
-            assert info["filename"] == "test.txt"
-            assert info["extension"] == ".txt"
-            assert info["size_bytes"] == len(test_content)
-            assert info["supported"] is True
-        finally:
-            test_file.unlink()
+        assert info["filename"] == "test.txt"
+        assert info["extension"] == ".txt"
+        assert info["size_bytes"] == len(test_content)
+        assert info["supported"] is True
 
     def test_get_document_info_nonexistent(self):
         """Test getting info for nonexistent file"""
@@ -0,0 +1,114 @@
+"""
+Tests for the document registry backing the web API
+"""
+
+import asyncio
+import os
+
+import pytest
+
+# Skip collection cleanly (instead of erroring) on environments without
+# the web stack installed; routes pulls in fastapi and the crew imports
+routes = pytest.importorskip("web_app.routes")
+
+
+class TestDocumentRegistry:
+    """Test cases for DocumentRegistry"""
+
+    def setup_method(self):
+        """Set up an empty registry"""
+        self.registry = routes.DocumentRegistry()
+
+    def _upload(self, tmp_path, name, content="content"):
+        """Write a file and register it, returning its stem"""
+        file_path = tmp_path / name
+        file_path.write_text(content)
+        asyncio.run(self.registry.register_upload(file_path))
+        return file_path.stem
+
+    def test_empty_registry(self):
+        """Test the initial state"""
+        assert len(self.registry) == 0
+        assert "missing" not in self.registry
+        assert self.registry.store_path("missing") is None
+        assert self.registry.most_recent() is None
+        assert self.registry.version == 0
+
+    def test_register_upload_records_metadata(self, tmp_path):
+        """Test that register_upload captures the file's stat fields"""
+        doc_name = self._upload(tmp_path, "notes.txt", "hello")
+
+        meta = self.registry.meta_snapshot()[doc_name]
+        assert meta["filename"] == "notes.txt"
+        assert meta["size_bytes"] == len("hello")
+        assert meta["extension"] == ".txt"
+        assert self.registry.version == 1
+
+    def test_add_store_makes_document_queryable(self, tmp_path):
+        """Test that a document appears once its store is registered"""
+        doc_name = self._upload(tmp_path, "notes.txt")
+        assert doc_name not in self.registry
+
+        asyncio.run(self.registry.add_store(doc_name, tmp_path / "notes_faiss_index"))
+        assert doc_name in self.registry
+        assert len(self.registry) == 1
+        assert self.registry.store_names() == [doc_name]
+        assert self.registry.store_path(doc_name) == tmp_path / "notes_faiss_index"
+
+    def test_most_recent_follows_upload_mtime(self, tmp_path):
+        """Test that most_recent picks the newest queryable document"""
+        first = self._upload(tmp_path, "first.txt")
+        asyncio.run(self.registry.add_store(first, tmp_path / "first_faiss_index"))
+
+        second_file = tmp_path / "second.txt"
+        second_file.write_text("content")
+        # Force a strictly newer mtime; back-to-back writes can tie
+        newer = second_file.stat().st_mtime + 10
+        os.utime(second_file, (newer, newer))
+        asyncio.run(self.registry.register_upload(second_file))
+
+        # Only documents with a store count as queryable
+        assert self.registry.most_recent() == first
+
+        second = second_file.stem
+        asyncio.run(self.registry.add_store(second, tmp_path / "second_faiss_index"))
+        assert self.registry.most_recent() == second
+
+    def test_remove_and_forget(self, tmp_path):
+        """Test that remove drops both store and metadata"""
+        doc_name = self._upload(tmp_path, "notes.txt")
+        asyncio.run(self.registry.add_store(doc_name, tmp_path / "notes_faiss_index"))
+
+        asyncio.run(self.registry.remove(doc_name))
+        assert doc_name not in self.registry
+        assert doc_name not in self.registry.meta_snapshot()
+
+        other = self._upload(tmp_path, "other.txt")
+        asyncio.run(self.registry.forget_upload(other))
+        assert other not in self.registry.meta_snapshot()
+
+    def test_clear_resets_everything_but_keeps_version_moving(self, tmp_path):
+        """Test that clear empties the registry and still bumps the version"""
+        doc_name = self._upload(tmp_path, "notes.txt")
+        asyncio.run(self.registry.add_store(doc_name, tmp_path / "notes_faiss_index"))
+        version_before = self.registry.version
+
+        asyncio.run(self.registry.clear())
+        assert len(self.registry) == 0
+        assert self.registry.meta_snapshot() == {}
+        assert self.registry.version == version_before + 1
+
+    def test_every_mutation_bumps_version(self, tmp_path):
+        """Test that each mutation invalidates the exposed ETag"""
+        doc_name = self._upload(tmp_path, "notes.txt")
+        asyncio.run(self.registry.add_store(doc_name, tmp_path / "notes_faiss_index"))
+        asyncio.run(self.registry.remove(doc_name))
+        asyncio.run(self.registry.clear())
+        assert self.registry.version == 4
+
+    def test_snapshots_are_copies(self, tmp_path):
+        """Test that mutating a snapshot doesn't touch the registry"""
+        doc_name = self._upload(tmp_path, "notes.txt")
+        snapshot = self.registry.meta_snapshot()
+        snapshot.clear()
+        assert doc_name in self.registry.meta_snapshot()
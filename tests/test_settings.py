@@ -0,0 +1,78 @@
+"""
+Tests for settings validation and environment resolution
+"""
+
+import pytest
+
+import config.settings as settings_module
+from config.settings import Settings, _env_list, _env_str
+
+
+@pytest.fixture(autouse=True)
+def _fresh_env_cache():
+    """Clear the one-shot .env cache around each test"""
+    settings_module._env.cache_clear()
+    yield
+    settings_module._env.cache_clear()
+
+
+class TestSettingsValidation:
+    """Test cases for Settings.__post_init__ validation"""
+
+    def test_valid_defaults(self):
+        """Test that the default configuration validates"""
+        settings = Settings()
+        assert settings.CHUNK_OVERLAP < settings.CHUNK_SIZE
+        assert settings.SEARCH_METHOD in ("similarity", "mmr", "smart", "detailed")
+
+    def test_chunk_overlap_must_be_smaller_than_chunk_size(self):
+        """Test that an overlap >= chunk size is rejected"""
+        with pytest.raises(ValueError, match="CHUNK_OVERLAP"):
+            Settings(CHUNK_SIZE=100, CHUNK_OVERLAP=200)
+
+    def test_mmr_diversity_factor_bounds(self):
+        """Test that the diversity factor must stay within [0, 1]"""
+        with pytest.raises(ValueError, match="MMR_DIVERSITY_FACTOR"):
+            Settings(MMR_DIVERSITY_FACTOR=1.5)
+        with pytest.raises(ValueError, match="MMR_DIVERSITY_FACTOR"):
+            Settings(MMR_DIVERSITY_FACTOR=-0.1)
+
+    def test_search_method_must_be_known(self):
+        """Test that an unknown search method is rejected"""
+        with pytest.raises(ValueError, match="SEARCH_METHOD"):
+            Settings(SEARCH_METHOD="bogus")
+
+
+class TestEnvResolution:
+    """Test cases for the .env / os.environ overlay helpers"""
+
+    def test_environ_wins_over_env_file(self, tmp_path, monkeypatch):
+        """Test that a real environment variable beats the .env entry"""
+        (tmp_path / ".env").write_text("DEMO_SETTING=from_file\n")
+        monkeypatch.setattr(settings_module, "_ROOT", tmp_path)
+
+        assert _env_str("DEMO_SETTING", "default") == "from_file"
+
+        settings_module._env.cache_clear()
+        monkeypatch.setenv("DEMO_SETTING", "from_environ")
+        assert _env_str("DEMO_SETTING", "default") == "from_environ"
+
+    def test_env_file_comments_and_blanks_are_skipped(self, tmp_path, monkeypatch):
+        """Test that comments and malformed lines don't produce entries"""
+        (tmp_path / ".env").write_text("# comment\n\nnot-an-assignment\nKEY=value\n")
+        monkeypatch.setattr(settings_module, "_ROOT", tmp_path)
+
+        assert _env_str("KEY", "default") == "value"
+        assert _env_str("NOT-AN-ASSIGNMENT", "default") == "default"
+
+    def test_env_list_parses_comma_separated_values(self, monkeypatch):
+        """Test list parsing with whitespace and empty items"""
+        monkeypatch.setenv("DEMO_LIST", " a, b ,,c ")
+        assert _env_list("DEMO_LIST", []) == ["a", "b", "c"]
+
+    def test_env_list_returns_copy_of_default(self):
+        """Test that an unset variable yields a fresh copy of the default"""
+        default = ["x", "y"]
+        result = _env_list("DEMO_UNSET_LIST", default)
+        assert result == default
+        assert result is not default